@@ -6,24 +6,72 @@ XRP AI BOT — FINAL PERFECTION (2025) + 7-COIN EMPIRE WITH PER-COIN NEWS
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import os
-from datetime import datetime
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from datetime import datetime, timezone
+from functools import lru_cache
 import pytz
-from discord_webhook import DiscordWebhook, DiscordEmbed
-import tweepy
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 CSV_FILE = "xrp_history.csv"
+CSV_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"  # written explicitly so a lone midnight bar keeps its time
+HISTORY_DIR = "xrp_history"
+LAST_TS_FILE = os.path.join(HISTORY_DIR, "_last_ts.txt")  # leading "_" keeps pyarrow from reading it
+NEWS_CACHE_DIR = ".news_cache"
+NEWS_TTL = 1800
+LAST_REPORT_FILE = "last_report.json"
 
 eastern = pytz.timezone('America/New_York')
 
-client = tweepy.Client(
-    bearer_token=os.environ["X_BEARER_TOKEN"],
-    consumer_key=os.environ["X_API_KEY"],
-    consumer_secret=os.environ["X_API_SECRET"],
-    access_token=os.environ["X_ACCESS_TOKEN"],
-    access_token_secret=os.environ["X_ACCESS_SECRET"]
-)
+FETCH_WORKERS = 4
+FETCH_TIMEOUT = (5, 10)  # (connect, read) seconds per attempt
+FETCH_DEADLINE = 60  # seconds to wait on a prefetched download; 3 attempts + capped backoff stay under it
+BB_PERIOD = 20
+SQUEEZE_LOOKBACK = 100
+
+# One pooled session so repeat CryptoCompare calls reuse the TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=2, pool_maxsize=FETCH_WORKERS,
+    # Retry-After is ignored so a 429 can't sleep past FETCH_DEADLINE; backoff_max caps the wait instead
+    max_retries=Retry(
+        total=2, backoff_factor=0.3, backoff_max=2, respect_retry_after_header=False,
+        status_forcelist=(429, 500, 502, 503, 504),
+    )
+))
+# requests already advertises every encoding urllib3 can decode (gzip, deflate, plus br/zstd
+# when brotli/zstandard are installed), so only the UA is set here
+_SESSION.headers.update({"User-Agent": "xrp-intel-bot/1.0"})
+
+@lru_cache(maxsize=None)
+def x_client():
+    # tweepy is only imported (and the X keys only read) when a tweet is actually sent
+    import tweepy
+    return tweepy.Client(
+        bearer_token=os.environ["X_BEARER_TOKEN"],
+        consumer_key=os.environ["X_API_KEY"],
+        consumer_secret=os.environ["X_API_SECRET"],
+        access_token=os.environ["X_ACCESS_TOKEN"],
+        access_token_secret=os.environ["X_ACCESS_SECRET"]
+    )
+
+TWEET_TEMPLATE = """{coin} • {now_est}
+${price:.4f} ({change_24h:+.2f}%)
+Bullish Probability: {bullish_prob}%
+Daily: {daily_struct} | 4H: {h4_struct}
+BB: {squeeze} {breakout}
+Price {dist_pct:.0f}% from lower band | RSI {rsi}
+#XRP #Crypto"""
 
 # ==================== 7 COINS CONFIG ====================
 COINS = {
@@ -37,31 +85,152 @@ COINS = {
 }
 # =======================================================
 
+HISTORY_COLUMNS = ["open_time", "open", "high", "low", "close", "volume"]
+
+HISTOHOUR_FIELDS = ["time", "open", "high", "low", "close", "volumeto"]
+
+def load_history():
+    # Parquet keeps open_time as datetime64, so no text parsing on the hot path;
+    # the CSV is only read once to migrate
+    if os.path.isdir(HISTORY_DIR):
+        return pd.read_parquet(HISTORY_DIR)
+    return pd.read_csv(
+        CSV_FILE, usecols=HISTORY_COLUMNS, engine="c",
+        dtype={c: "float64" for c in HISTORY_COLUMNS[1:]},
+        parse_dates=["open_time"], date_format=CSV_DATE_FORMAT
+    )
+
+def _last_history_time():
+    try:
+        with open(LAST_TS_FILE) as f:
+            return pd.Timestamp(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+def _write_partitions(rows):
+    # One file per calendar month, so a run only rewrites the month(s) it adds to
+    os.makedirs(HISTORY_DIR, exist_ok=True)
+    for month, chunk in rows.groupby(rows["open_time"].dt.strftime("%Y-%m")):
+        path = os.path.join(HISTORY_DIR, f"{month}.parquet")
+        if os.path.exists(path):
+            existing = pd.read_parquet(path)
+            chunk = pd.concat([existing, chunk[chunk["open_time"] > existing["open_time"].max()]], ignore_index=True)
+        chunk.to_parquet(path, compression="zstd", index=False)
+    with open(LAST_TS_FILE, "w") as f:
+        f.write(rows["open_time"].max().isoformat())
+
+def update_history(new_rows):
+    # Append only candles newer than the recorded high-water mark; history itself is never scanned
+    last_ts = _last_history_time()
+    if last_ts is None:
+        # Only a missing store means "start fresh"; a store that fails to read must not be overwritten
+        try:
+            old = load_history()
+        except FileNotFoundError:
+            old = None
+        if old is not None:
+            new_rows = pd.concat([old, new_rows[new_rows["open_time"] > old["open_time"].max()]], ignore_index=True)
+        fresh = new_rows
+    else:
+        fresh = new_rows[new_rows["open_time"] > last_ts]
+    if fresh.empty:
+        return
+
+    _write_partitions(fresh)
+    if os.environ.get("WRITE_CSV"):
+        if last_ts is None:
+            fresh.to_csv(CSV_FILE, index=False, date_format=CSV_DATE_FORMAT)
+        else:
+            fresh.to_csv(CSV_FILE, mode="a", header=False, index=False, date_format=CSV_DATE_FORMAT)
+
 def fetch_data(coin):
     url = "https://min-api.cryptocompare.com/data/v2/histohour"
-    resp = requests.get(url, params={"fsym": coin, "tsym": "USDT", "limit": 2000}, timeout=20)
-    data = resp.json()["Data"]["Data"]
-    df = pd.DataFrame([d for d in data if d["time"] > 0])
-    df["time"] = pd.to_datetime(df["time"], unit="s")
-    df.rename(columns={"volumeto": "volume"}, inplace=True)
-
-    hourly = df[["time", "open", "high", "low", "close", "volume"]].set_index("time")
+    resp = _SESSION.get(url, params={"fsym": coin, "tsym": "USDT", "limit": 2000}, timeout=FETCH_TIMEOUT)
+    data = json_loads(resp.content)["Data"]["Data"]
+    # Only pull the fields we keep; conversionType/volumefrom etc. never become columns
+    df = pd.DataFrame.from_records(data, columns=HISTOHOUR_FIELDS)
+    df.columns = HISTORY_COLUMNS  # time -> open_time, volumeto -> volume; the rest already match
+
+    # Materialize OHLCV as typed float64 columns in one go, masking out placeholder rows
+    times = df["open_time"].to_numpy()
+    live = times > 0
+    hourly = pd.DataFrame(
+        {c: df[c].to_numpy(dtype=np.float64)[live] for c in HISTORY_COLUMNS[1:]},
+        index=pd.DatetimeIndex(pd.to_datetime(times[live], unit="s"), name="open_time"),
+    )
     df_4h = hourly.resample('4h').agg({'open':'first','high':'max','low':'min','close':'last','volume':'sum'}).dropna()
     df_daily = hourly.resample('1D').agg({'open':'first','high':'max','low':'min','close':'last','volume':'sum'}).dropna()
 
     return hourly, df_4h, df_daily
 
+def fetch_news(coin):
+    # Serve a recent copy from disk, and fall back to the last good one if the fetch fails
+    path = os.path.join(NEWS_CACHE_DIR, f"{coin}.json")
+    try:
+        with open(path) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        cached = None
+    if cached and time.time() - cached["ts"] < NEWS_TTL:
+        return cached["items"]
+
+    try:
+        news_resp = json_loads(_SESSION.get(
+            f"https://min-api.cryptocompare.com/data/v2/news/?lang=EN&categories={coin}",
+            timeout=FETCH_TIMEOUT
+        ).content)
+        articles = news_resp.get("Data", [])[:4]
+    except Exception as e:
+        if cached:
+            print(f"{coin} news fetch failed ({e}), using cached copy")
+            return cached["items"]
+        raise
+
+    os.makedirs(NEWS_CACHE_DIR, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"ts": time.time(), "items": articles}, f)
+    return articles
+
+def _last_reported():
+    # coin -> {"discord": ts, "tweet": ts}: open_time (unix seconds) of the newest bar each went out for
+    try:
+        with open(LAST_REPORT_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _mark_reported(coin, channel, ts):
+    sent = _last_reported()
+    sent.setdefault(coin, {})[channel] = ts
+    with open(LAST_REPORT_FILE, "w") as f:
+        json.dump(sent, f)
+
+def _post_webhook(webhook):
+    # With rate_limit_retry, discord_webhook raises on a 429 it can't retry and crashes on a failed
+    # retry instead of returning a response, so both come back here as an ordinary failure
+    try:
+        resp = webhook.execute()
+    except Exception as e:
+        return False, f"post failed: {e}"
+    return resp.ok, f"Discord returned {resp.status_code}"
+
+def _swing_points(values, window, extreme):
+    # A bar is a swing point when it is the extreme of the centered 2*window+1 bars around it
+    span = 2 * window + 1
+    if len(values) < span:
+        return values[:0]
+    centre = values[window:len(values) - window]
+    return centre[centre == extreme(sliding_window_view(values, span), axis=1)]
+
 def market_structure(df, timeframe):
     try:
         window = 10 if timeframe == "Daily" else 15
-        high_roll = df['high'].rolling(2*window+1, center=True).max()
-        low_roll = df['low'].rolling(2*window+1, center=True).min()
-        highs = df['high'][df['high'] == high_roll].dropna().tail(4)
-        lows = df['low'][df['low'] == low_roll].dropna().tail(4)
-        if len(highs) < 3 or len(lows) < 3:
+        h = _swing_points(df['high'].to_numpy(dtype=np.float64), window, np.max)[-3:]
+        l = _swing_points(df['low'].to_numpy(dtype=np.float64), window, np.min)[-3:]
+        if len(h) < 3 or len(l) < 3:
             return "Ranging/Choppy"
-        hh_hl = (highs.iloc[-1] > highs.iloc[-2] > highs.iloc[-3] and lows.iloc[-1] > lows.iloc[-2] > lows.iloc[-3])
-        lh_ll = (highs.iloc[-1] < highs.iloc[-2] < highs.iloc[-3] and lows.iloc[-1] < lows.iloc[-2] < lows.iloc[-3])
+        hh_hl = h[2] > h[1] > h[0] and l[2] > l[1] > l[0]
+        lh_ll = h[2] < h[1] < h[0] and l[2] < l[1] < l[0]
         if hh_hl: return "Bullish (HH+HL)"
         if lh_ll: return "Bearish (LH+LL)"
         return "Ranging/Choppy"
@@ -69,92 +238,105 @@ def market_structure(df, timeframe):
         return "Unavailable"
 
 def bollinger_analysis(df_4h):
-    df = df_4h.copy()
-    df['mid'] = df['close'].rolling(20).mean()
-    df['std'] = df['close'].rolling(20).std()
-    df['upper'] = df['mid'] + (df['std'] * 2)
-    df['lower'] = df['mid'] - (df['std'] * 2)
-    df['bandwidth'] = (df['upper'] - df['lower']) / df['mid']
-    df['distance_from_lower'] = (df['close'] - df['lower']) / (df['upper'] - df['lower'])
-
-    latest = df.iloc[-1]
-    prev = df.iloc[-2]
-
-    dist_pct = latest['distance_from_lower'] * 100
-    current_bandwidth = latest['bandwidth']
-    squeeze_threshold = df['bandwidth'].rolling(100).quantile(0.1).iloc[-1]
+    # The squeeze threshold is the widest look-back; nothing older reaches the last bar
+    close = df_4h['close'].tail(BB_PERIOD + SQUEEZE_LOOKBACK - 1)
+    window = close.rolling(BB_PERIOD)
+    mid = window.mean()
+    std = window.std()
+    upper = mid + (std * 2)
+    lower = mid - (std * 2)
+    bandwidth = (upper - lower) / mid
+
+    # Only the last two bars matter, so read them as plain floats rather than row Series
+    close_prev, close_now = close.to_numpy()[-2:]
+    upper_prev, upper_now = upper.to_numpy()[-2:]
+    lower_prev, lower_now = lower.to_numpy()[-2:]
+
+    with np.errstate(divide="ignore", invalid="ignore"):  # flat bands give NaN, as the Series math did
+        dist_pct = (close_now - lower_now) / (upper_now - lower_now) * 100
+    current_bandwidth = bandwidth.iat[-1]
+    squeeze_threshold = bandwidth.rolling(SQUEEZE_LOOKBACK).quantile(0.1).iat[-1]
     squeeze = "SQUEEZE ACTIVE" if pd.notna(squeeze_threshold) and current_bandwidth < squeeze_threshold else "No Squeeze"
 
     breakout_dir = ""
-    if prev['close'] <= prev['upper'] and latest['close'] > latest['upper']:
+    if close_prev <= upper_prev and close_now > upper_now:
         breakout_dir = "BULLISH BREAKOUT"
-    elif prev['close'] >= prev['lower'] and latest['close'] < latest['lower']:
+    elif close_prev >= lower_prev and close_now < lower_now:
         breakout_dir = "BEARISH BREAKOUT"
 
     return {
-        'upper': latest['upper'], 'lower': latest['lower'], 'mid': latest['mid'],
+        'upper': upper_now, 'lower': lower_now, 'mid': mid.iat[-1],
         'dist_pct': dist_pct, 'squeeze': squeeze, 'breakout': breakout_dir
     }
 
+def calculate_rsi(close, period):
+    # Only the last `period` changes reach the final bar, so skip the rest of the history
+    c = close.to_numpy(dtype=np.float64)[-(period + 1):]
+    if len(c) <= period:
+        raise ValueError(f"need {period + 1} closes for RSI({period})")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = c[1:] / c[:-1] - 1
+        ratio = np.clip(change, 0, None).mean() / np.abs(change).mean()
+    if ratio == 0 or ratio == np.inf:
+        ratio = 1
+    return int(100 - (100 / (1 + ratio)))
+
 # BULLISH PROBABILITY CALCULATION
 def calculate_bullish_probability(bb, rsi, daily_struct, h4_struct):
-    score = 50  # neutral base
-
-    # BB position (strongest weight)
-    score += (bb['dist_pct'] - 50) * 0.6
-
-    # RSI
-    if rsi < 30:
-        score -= 15
-    elif rsi > 70:
-        score += 15
-    else:
-        score += (rsi - 50) * 0.3
-
-    # Market Structure
-    if "Bullish" in daily_struct:
-        score += 20
-    elif "Bearish" in daily_struct:
-        score -= 20
-
-    if "Bullish" in h4_struct:
-        score += 15
-    elif "Bearish" in h4_struct:
-        score -= 15
-
-    # Squeeze + Breakout bonus
-    if bb['squeeze'] == "SQUEEZE ACTIVE":
-        score += 12
-    if "BULLISH BREAKOUT" in bb['breakout']:
-        score += 18
-    elif "BEARISH BREAKOUT" in bb['breakout']:
-        score -= 18
+    # (weight, condition) pairs: each on/off signal carries its own weight
+    signals = (
+        # Market Structure
+        (20, "Bullish" in daily_struct), (-20, "Bearish" in daily_struct),
+        (15, "Bullish" in h4_struct), (-15, "Bearish" in h4_struct),
+        # Squeeze + Breakout bonus
+        (12, bb['squeeze'] == "SQUEEZE ACTIVE"),
+        (18, "BULLISH BREAKOUT" in bb['breakout']), (-18, "BEARISH BREAKOUT" in bb['breakout']),
+    )
+    score = sum((
+        # BB position (strongest weight)
+        (bb['dist_pct'] - 50) * 0.6,
+        # RSI
+        -15 if rsi < 30 else 15 if rsi > 70 else (rsi - 50) * 0.3,
+        *(w for w, on in signals if on),
+    ), 50)  # neutral base
 
     probability = max(5, min(95, round(score)))  # clamp 5–95%
     return probability
 
-def send_report(coin):
+def send_report(coin, market=None, news=None):
     webhook_url = os.environ.get(f"DISCORD_WEBHOOK_{coin}")
     if not webhook_url:
         print(f"{coin} → No webhook, skipping")
         return
 
+    from discord_webhook import DiscordWebhook, DiscordEmbed
+
     try:
-        hourly, df_4h, df_daily = fetch_data(coin)
+        try:
+            hourly, df_4h, df_daily = market.result(timeout=FETCH_DEADLINE) if market else fetch_data(coin)
+        except FutureTimeout:
+            print(f"{coin} failed: no market data after {FETCH_DEADLINE}s")
+            return
 
-        # Save XRP history only
+        # Save XRP history only; a store that can't be read is left alone, but the report still goes out
         if coin == "XRP":
-            hourly_reset = hourly.reset_index().rename(columns={"time": "open_time"})
             try:
-                old = pd.read_csv(CSV_FILE)
-                old["open_time"] = pd.to_datetime(old["open_time"])
-                combined = pd.concat([old, hourly_reset]).drop_duplicates("open_time")
-            except:
-                combined = hourly_reset
-            combined.to_csv(CSV_FILE, index=False)
-
-        price = df_4h['close'].iloc[-1]
-        change_24h = (price / df_4h['close'].iloc[-6] - 1) * 100 if len(df_4h) >= 6 else 0
+                update_history(hourly.reset_index())
+            except Exception as e:
+                print(f"XRP history not saved: {e}")
+
+        # Reruns inside the same hour see the same bar; only redo whatever didn't go out for it
+        latest_ts = int(hourly.index[-1].timestamp())
+        done = _last_reported().get(coin, {})
+        post_discord = done.get("discord") != latest_ts
+        post_tweet = coin == "XRP" and done.get("tweet") != latest_ts
+        if not (post_discord or post_tweet):
+            print(f"{coin} → No new bar since last report, skipping")
+            return
+
+        close_4h = df_4h['close'].to_numpy()
+        price = close_4h[-1]
+        change_24h = (price / close_4h[-6] - 1) * 100 if len(close_4h) >= 6 else 0
         now_est = datetime.now(eastern).strftime("%I:%M %p EST")
         bb = bollinger_analysis(df_4h)
 
@@ -168,16 +350,10 @@ def send_report(coin):
             oversold = 30
             exit_level = 50
 
-            rsi = int(100 - (100 / (1 + (
-                df_4h['close'].pct_change().clip(lower=0).rolling(rsi_period).mean() /
-                abs(df_4h['close'].pct_change()).rolling(rsi_period).mean()
-            ).replace([0, float('inf')], 1)).iloc[-1]))
+            rsi = calculate_rsi(df_4h['close'], rsi_period)
 
-            rsi_signal = "HOLD"
-            if rsi < oversold:
-                rsi_signal = "BUY"
-            elif rsi > exit_level:
-                rsi_signal = "EXIT"
+            # Thresholds are ordered, so counting the ones crossed picks the signal
+            rsi_signal = ("BUY", "HOLD", "EXIT")[(rsi >= oversold) + (rsi > exit_level)]
 
             rsi_field = f"{rsi} → {rsi_signal}"
 
@@ -185,7 +361,8 @@ def send_report(coin):
         bullish_prob = calculate_bullish_probability(bb, rsi if rsi_field else 50, daily_struct, h4_struct)
 
         # MAIN REPORT
-        embed = DiscordEmbed(title=f"{coin} Market Report", color=COINS[coin]["color"])
+        style = COINS[coin]
+        embed = DiscordEmbed(title=f"{coin} Market Report", color=style["color"])
         embed.add_embed_field(
             name="**Bullish Probability**",
             value=f"**{bullish_prob}%**",
@@ -203,53 +380,65 @@ def send_report(coin):
         if rsi_field:
             embed.add_embed_field(name=f"RSI (14) (4H)", value=rsi_field, inline=True)
 
-        embed.set_thumbnail(url=COINS[coin]["thumb"])
+        embed.set_thumbnail(url=style["thumb"])
         embed.set_footer(text=f"Updated {now_est} | 4× Daily Report")
-        embed.timestamp = datetime.utcnow().isoformat()
+        embed.timestamp = datetime.now(timezone.utc).isoformat()
 
-        webhook = DiscordWebhook(url=webhook_url)
-        webhook.add_embed(embed)
-        webhook.execute()
-        print(f"{coin} → Report sent! (Bullish Probability: {bullish_prob}%)")
+        if post_discord:
+            # PER-COIN NEWS (rides in the same webhook POST as the report)
+            news_embeds = []
+            try:
+                articles = news.result(timeout=FETCH_DEADLINE) if news else fetch_news(coin)
 
-        # PER-COIN NEWS
-        try:
-            news_resp = requests.get(
-                f"https://min-api.cryptocompare.com/data/v2/news/?lang=EN&categories={coin}",
-                timeout=10
-            ).json()
-            articles = news_resp.get("Data", [])[:4]
-
-            if articles:
-                news_hook = DiscordWebhook(url=webhook_url)
-                news_hook.set_content(f"**Latest {coin} News**")
                 for a in articles:
                     e = DiscordEmbed(
                         title=a['title'][:256],
                         description=(a['body'][:390] + "...") if len(a['body']) > 390 else a['body'],
-                        color=COINS[coin]["color"],
+                        color=style["color"],
                         url=a['url']
                     )
                     if a.get('imageurl'):
                         e.set_image(url=a['imageurl'])
                     e.set_footer(text="Click title → full article")
-                    e.timestamp = datetime.utcfromtimestamp(a['published_on']).isoformat()
-                    news_hook.add_embed(e)
-                news_hook.execute()
-                print(f"{coin} → News delivered!")
-        except Exception as e:
-            print(f"{coin} news failed: {e}")
+                    e.timestamp = datetime.fromtimestamp(a['published_on'], timezone.utc).isoformat()
+                    news_embeds.append(e)
+                if news_embeds:
+                    news_embeds[0].set_author(name=f"Latest {coin} News")
+            except Exception as e:
+                print(f"{coin} news failed: {e}")
+                news_embeds = []
+
+            # Report + up to 4 articles stays well inside Discord's 10-embed / 6000-char cap
+            webhook = DiscordWebhook(url=webhook_url, rate_limit_retry=True)
+            webhook.add_embed(embed)
+            for e in news_embeds:
+                webhook.add_embed(e)
+            ok, status = _post_webhook(webhook)
+            if not ok and news_embeds:
+                # A bad article (e.g. a url/imageurl Discord rejects) mustn't take the report down with it
+                print(f"{coin} report + news rejected ({status}), resending report alone")
+                news_embeds = []
+                webhook.remove_embeds()
+                webhook.add_embed(embed)
+                ok, status = _post_webhook(webhook)
+            if ok:
+                _mark_reported(coin, "discord", latest_ts)
+                print(f"{coin} → Report sent! (Bullish Probability: {bullish_prob}%)")
+                if news_embeds:
+                    print(f"{coin} → News delivered!")
+            else:
+                print(f"{coin} → Report failed: {status}")
 
         # TWEET ONLY XRP (unchanged)
-        if coin == "XRP":
-            tweet = f"""{coin} • {now_est}
-${price:.4f} ({change_24h:+.2f}%)
-Bullish Probability: {bullish_prob}%
-Daily: {daily_struct} | 4H: {h4_struct}
-BB: {bb['squeeze']} {bb['breakout']}
-Price {bb['dist_pct']:.0f}% from lower band | RSI {rsi_field if rsi_field else 'N/A'}
-#XRP #Crypto"""
-            client.create_tweet(text=tweet)
+        if post_tweet:
+            tweet = TWEET_TEMPLATE.format(
+                coin=coin, now_est=now_est, price=price, change_24h=change_24h,
+                bullish_prob=bullish_prob, daily_struct=daily_struct, h4_struct=h4_struct,
+                squeeze=bb['squeeze'], breakout=bb['breakout'], dist_pct=bb['dist_pct'],
+                rsi=rsi_field if rsi_field else 'N/A'
+            )
+            x_client().create_tweet(text=tweet)
+            _mark_reported(coin, "tweet", latest_ts)
             print("XRP → Tweeted with Bullish Probability!")
 
     except Exception as e:
@@ -257,5 +446,11 @@ Price {bb['dist_pct']:.0f}% from lower band | RSI {rsi_field if rsi_field else '
 
 # ============================= MAIN =============================
 if __name__ == "__main__":
-    for coin in ["XRP", "BTC", "ADA", "ZEC", "HBAR", "ETH", "SOL"]:
-        send_report(coin)
+    coins = ["XRP", "BTC", "ADA", "ZEC", "HBAR", "ETH", "SOL"]
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        # Start every coin's candle and news downloads up front so the network waits overlap
+        active = [coin for coin in coins if os.environ.get(f"DISCORD_WEBHOOK_{coin}")]
+        markets = {coin: pool.submit(fetch_data, coin) for coin in active}
+        news = {coin: pool.submit(fetch_news, coin) for coin in active}
+        for coin in coins:
+            send_report(coin, markets.get(coin), news.get(coin))